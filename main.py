@@ -1,6 +1,9 @@
 import streamlit as st
-import time
-from seo_analyzer import SEOAnalyzer
+import multiprocessing
+import queue
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from seo_analyzer import CACHE_TTL, run_analysis
 from visualizer import create_score_gauge, create_metrics_chart
 from utils import is_valid_url
 
@@ -12,6 +15,57 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Workers are spawned, not forked: forking the multithreaded Streamlit server can
+# leave a child stuck on a lock that another server thread held
+_MP_CONTEXT = multiprocessing.get_context('spawn')
+
+@st.cache_resource
+def get_analysis_pool():
+    """Worker processes that keep parsing and scoring off the Streamlit script thread"""
+    return ProcessPoolExecutor(max_workers=2, mp_context=_MP_CONTEXT)
+
+@st.cache_resource
+def get_progress_manager():
+    """Manager whose queues carry stage updates back from the worker processes"""
+    return _MP_CONTEXT.Manager()
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=64, show_spinner=False)
+def analyze_url(url):
+    """Analyze url in a worker process, showing each stage as it completes
+
+    Results are kept here rather than in the workers, so every rerun and session sees
+    the same copy, and the Re-analyze button can drop it.
+    """
+    # Progress indicators; created here so a cache hit can replay them
+    progress_bar = st.progress(0)
+    status_text = st.empty()
+
+    status_text.text("Initializing analysis...")
+
+    stages = get_progress_manager().Queue()
+    try:
+        # The workers skip their own page cache; this one decides when to refetch
+        future = get_analysis_pool().submit(run_analysis, url, stages, 0)
+        while True:
+            try:
+                stage, percent = stages.get(timeout=0.1)
+            except queue.Empty:
+                if future.done():
+                    break
+                continue
+            status_text.text(stage)
+            progress_bar.progress(percent)
+        results = future.result()
+    except BrokenProcessPool:
+        # A crashed worker poisons the pool, so start a fresh one next run
+        get_analysis_pool.clear()
+        raise
+
+    # Clear progress indicators
+    progress_bar.empty()
+    status_text.empty()
+    return results
+
 # Custom CSS with animations and responsive design
 st.markdown("""
     <style>
@@ -134,36 +188,14 @@ if url:
     if not is_valid_url(url):
         st.error("Please enter a valid URL including http:// or https://")
     else:
+        # Results are reused for CACHE_TTL seconds unless the user asks for a fresh run
+        if st.button("Re-analyze", help="Fetch and analyze the page again instead of reusing recent results"):
+            analyze_url.clear(url)
+
         with st.spinner("Analyzing website... This may take a minute"):
             try:
-                # Progress indicators
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-
-                # Initialize analyzer
-                analyzer = SEOAnalyzer(url)
-                status_text.text("Initializing analysis...")
-                progress_bar.progress(20)
-                time.sleep(0.3)
-
-                # Perform analysis
-                status_text.text("Analyzing website content...")
-                progress_bar.progress(40)
-                time.sleep(0.3)
-
-                results = analyzer.analyze()
-
-                status_text.text("Processing results...")
-                progress_bar.progress(80)
-                time.sleep(0.3)
-
-                progress_bar.progress(100)
-                status_text.text("Analysis complete!")
-                time.sleep(0.3)
-
-                # Clear progress indicators
-                progress_bar.empty()
-                status_text.empty()
+                # Perform analysis in a worker process
+                results = analyze_url(url)
 
                 # Responsive layout
                 with st.container():
@@ -179,18 +211,14 @@ if url:
                     with col1:
                         st.markdown("### Overall SEO Score")
                         create_score_gauge(results['overall_score'])
-                        time.sleep(0.2)
 
                         st.markdown("### Performance Metrics")
                         create_metrics_chart(results['metrics'])
-                        time.sleep(0.2)
 
                     with col2:
                         st.markdown("### Quick Stats")
                         st.metric("Page Load Time", f"{results['load_time']:.2f}s")
-                        time.sleep(0.1)
                         st.metric("Mobile Friendly", "✅ Yes" if results['mobile_friendly'] else "❌ No")
-                        time.sleep(0.1)
                         st.metric("SSL Certified", "✅ Yes" if results['ssl_certified'] else "❌ No")
 
                     st.markdown("</div>", unsafe_allow_html=True)
@@ -208,7 +236,6 @@ if url:
                     st.markdown('<div class="analysis-section">', unsafe_allow_html=True)
                     st.markdown("#### 🏷️ Meta Tags Analysis")
                     for item in results['meta_analysis']:
-                        time.sleep(0.1)
                         if "optimal" in item.lower() or "found" in item.lower():
                             st.success(item)
                         elif "missing" in item.lower() or "too" in item.lower():
@@ -243,7 +270,6 @@ if url:
                     with col1:
                         st.markdown("##### Content Metrics")
                         for category, items in metrics.items():
-                            time.sleep(0.1)
                             with st.expander(category, expanded=True):
                                 for item in items:
                                     st.write(item)
@@ -251,7 +277,6 @@ if url:
                     with col2:
                         st.markdown("##### Keyword Analysis")
                         for item in keywords:
-                            time.sleep(0.1)
                             st.write(item)
                     st.markdown("</div>", unsafe_allow_html=True)
 
@@ -269,7 +294,6 @@ if url:
 
                         with col1:
                             for item in technical_items[:mid]:
-                                time.sleep(0.1)
                                 if "not" in item.lower() or "needs" in item.lower():
                                     st.error(item)
                                 else:
@@ -277,14 +301,12 @@ if url:
 
                         with col2:
                             for item in technical_items[mid:]:
-                                time.sleep(0.1)
                                 if "not" in item.lower() or "needs" in item.lower():
                                     st.error(item)
                                 else:
                                     st.success(item)
                     else:
                         for item in technical_items:
-                            time.sleep(0.1)
                             if "not" in item.lower() or "needs" in item.lower():
                                 st.error(item)
                             else:
@@ -297,7 +319,6 @@ if url:
                     st.markdown('<div class="analysis-section">', unsafe_allow_html=True)
                     st.markdown("#### ⚡ Speed Analysis")
                     for item in results['speed_analysis']:
-                        time.sleep(0.1)
                         if "slow" in item.lower() or "large" in item.lower():
                             st.error(item)
                         else:
@@ -309,7 +330,6 @@ if url:
                     st.markdown('<div class="analysis-section">', unsafe_allow_html=True)
                     st.markdown("#### 🔒 Security Analysis")
                     for item in results['security_analysis']:
-                        time.sleep(0.1)
                         if "not" in item.lower() or "risk" in item.lower():
                             st.error(item)
                         else:
@@ -321,7 +341,6 @@ if url:
                     st.markdown('<div class="analysis-section">', unsafe_allow_html=True)
                     st.markdown("#### 🔗 Link Analysis")
                     for item in results['link_analysis']:
-                        time.sleep(0.1)
                         if "broken" in item.lower():
                             st.error(item)
                         else:
@@ -345,13 +364,11 @@ if url:
                         cols = st.columns(2)
                         for idx, (category, improvements) in enumerate(grouped_improvements.items()):
                             with cols[idx % 2]:
-                                time.sleep(0.1)
                                 with st.expander(f"{category} Improvements", expanded=True):
                                     for improvement in improvements:
                                         st.markdown(f"🔸 {improvement}")
                     else:
                         for category, improvements in grouped_improvements.items():
-                            time.sleep(0.1)
                             with st.expander(f"{category} Improvements", expanded=True):
                                 for improvement in improvements:
                                     st.markdown(f"🔸 {improvement}")
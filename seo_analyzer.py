@@ -1,52 +1,202 @@
+import asyncio
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from lxml import etree, html
 import trafilatura
+from trafilatura.utils import decode_file
 from urllib.parse import urlparse, urljoin
 import whois
 from datetime import datetime
 import time
 import re
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
+# Matches the parser trafilatura builds internally so its extraction is unaffected
+_HTML_PARSER = html.HTMLParser(collect_ids=False, remove_comments=True, remove_pis=True)
+
+# The tags the meta and technical checks look at, in document order
+_HEAD_XPATH = etree.XPath('//title|//meta|//link')
+
+# Headings, images and links are collected from the lxml tree in one compiled walk
+_HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+_STRUCTURE_TAGS = _HEADING_TAGS + ('img', 'a')
+_STRUCTURE_XPATH = etree.XPath('|'.join(f'//{tag}' for tag in _STRUCTURE_TAGS))
+
+# Bodies are truncated past this size; lxml recovers from the cut-off markup
+MAX_PAGE_BYTES = 5 * 1024 * 1024
+
+# Keyword candidates: runs of 4+ letters (digits, underscores and punctuation excluded)
+_WORD_RE = re.compile(r"[^\W\d_]{4,}")
+
+_OG_PROPERTY_RE = re.compile('^og:')
+
+# (score key, category name, issue pattern, penalty per issue, weight in overall score)
+_SCORING_RULES = (
+    ('meta', 'Meta Tags', re.compile('missing|too|no'), 15, 0.2),
+    ('content', 'Content', re.compile('missing|too short|multiple'), 10, 0.25),
+    ('technical', 'Technical', re.compile('not|slow|needs'), 20, 0.15),
+    ('speed', 'Speed', re.compile('slow|large'), 25, 0.15),
+    ('security', 'Security', re.compile('not|risk|could not'), 30, 0.15),
+    ('links', 'Links', re.compile('broken|invalid'), 15, 0.1)
+)
+
+# Findings matching any of these are turned into improvement suggestions
+_IMPROVEMENT_RE = re.compile('missing|too|no|not|slow|large|multiple|broken')
+
+# Rewrites that turn a finding into an actionable suggestion, applied in one scan
+_SUGGESTION_REWRITES = {
+    'Missing': 'Add',
+    'Too short': 'Increase length of',
+    'Too long': 'Reduce length of',
+    'No ': 'Add ',
+    'Not ': 'Enable '
+}
+_SUGGESTION_RE = re.compile('|'.join(map(re.escape, _SUGGESTION_REWRITES)))
+
+def _is_html(response):
+    """Whether the response is (or may be) an HTML document worth parsing"""
+    content_type = response.headers.get('Content-Type')
+    return content_type is None or 'html' in content_type.lower()
+
+def _decode_body(response, body):
+    """Decode the page body, sniffing its encoding unless the server declared a charset"""
+    # requests reports ISO-8859-1 for any text/* type without a charset, so its
+    # encoding is only trusted when the Content-Type header actually names one
+    if 'charset=' in response.headers.get('Content-Type', '').lower():
+        try:
+            return body.decode(response.encoding, errors='replace')
+        except LookupError:
+            pass
+    try:
+        return body.decode('utf-8')
+    except UnicodeDecodeError as error:
+        # A body cut off at MAX_PAGE_BYTES can end partway through a character
+        if error.reason == 'unexpected end of data':
+            return body[:error.start].decode('utf-8')
+    return decode_file(body)
+
+def _ignore_stage(name, percent):
+    """Default progress callback for analyses nobody is watching"""
+
+def _create_session():
+    """HTTP session whose keep-alive connection pool is shared by all analyzers"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+_SESSION = _create_session()
+
+# Seconds an analysis waits for WHOIS before reporting it as unavailable
+WHOIS_TIMEOUT = 3.0
+
+# Audits analyze_many() runs at once unless told otherwise
+BATCH_CONCURRENCY = 10
+
+# Lookups get their own threads: asyncio.run() waits for the default executor on
+# shutdown, which would let a lookup that outlived its timeout stall the analysis.
+# One thread per audit lets a default-sized batch look up all its domains at once.
+_WHOIS_EXECUTOR = ThreadPoolExecutor(max_workers=BATCH_CONCURRENCY, thread_name_prefix='whois')
+
+# Seconds a fetched page and its parse are reused by later analyses of the same URL
+CACHE_TTL = 300
+
+# Most (url, method) entries kept at once; each audited page takes two
+CACHE_MAX_ENTRIES = 32
+
+# (url, method) -> (time.monotonic() when stored, value), shared by all analyzers
+_CACHE = {}
+
+def _cached(url, method, factory, ttl):
+    """Return the cached result of method for url, rebuilding it once older than ttl"""
+    now = time.monotonic()
+    entry = _CACHE.get((url, method))
+    if entry is not None and now - entry[0] < ttl:
+        return entry[1]
+    value = factory()
+    # Expired entries are dropped, and the oldest ones too while the cache is full
+    _CACHE.pop((url, method), None)
+    entries = list(_CACHE.items())
+    excess = len(entries) + 1 - CACHE_MAX_ENTRIES
+    for index, (key, (stored, _)) in enumerate(entries):
+        if index < excess or now - stored >= ttl:
+            _CACHE.pop(key, None)
+    _CACHE[(url, method)] = (now, value)
+    return value
+
+@lru_cache(maxsize=1024)
+def _whois_lookup(domain):
+    """WHOIS lookup shared by all analyzers; failed lookups are not cached"""
+    # The socket timeout frees the thread of a lookup the analysis stopped waiting for
+    return whois.whois(domain, timeout=WHOIS_TIMEOUT)
+
 class SEOAnalyzer:
-    def __init__(self, url):
+    def __init__(self, url, cache_ttl=CACHE_TTL):
         self.url = url
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
-
-    def analyze(self):
-        """Perform complete SEO analysis of the website"""
-        start_time = time.time()
-
-        # Fetch page content
-        response = requests.get(self.url, headers=self.headers)
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        # Extract main text content
-        downloaded = trafilatura.fetch_url(self.url)
-        text_content = trafilatura.extract(downloaded)
-
-        # Perform various analyses
-        meta_analysis = self.analyze_meta_tags(soup)
-        content_analysis = self.analyze_content(soup, text_content)
-        technical_analysis = self.analyze_technical(response, soup)
-        speed_analysis = self.analyze_speed(response)
-        security_analysis = self.analyze_security()
-        link_analysis = self.analyze_links(soup)
-
-        # Generate improvements
-        improvements = self.generate_improvements(
-            meta_analysis, content_analysis, technical_analysis,
-            speed_analysis, security_analysis, link_analysis
-        )
-
-        # Calculate scores
-        scores = self.calculate_scores(
-            meta_analysis, content_analysis, technical_analysis,
-            speed_analysis, security_analysis, link_analysis
+        self.session = _SESSION
+        self.cache_ttl = cache_ttl
+
+    def analyze(self, on_stage=None):
+        """Perform complete SEO analysis, calling on_stage(name, percent) as stages finish"""
+        return asyncio.run(self._analyze_async(on_stage or _ignore_stage))
+
+    def refresh(self):
+        """Discard the cached page so the next analysis fetches it again"""
+        _CACHE.pop((self.url, 'page'), None)
+        _CACHE.pop((self.url, 'document'), None)
+
+    async def _analyze_async(self, on_stage):
+        """Run the network-bound lookups concurrently, then analyze the page"""
+        # Fetch page content and domain registration info concurrently
+        on_stage("Fetching page and domain information...", 10)
+        (response, body, fetch_time), domain_info = await asyncio.gather(
+            asyncio.to_thread(_cached, self.url, 'page', self._fetch_page, self.cache_ttl),
+            self._fetch_domain_info()
         )
-
+        # A cached page reports how long it took to download, not the cache lookup
+        start_time = time.time() - fetch_time
+
+        # Perform various analyses; page-level checks only apply to HTML documents
+        unanalyzed = ()
+        if _is_html(response):
+            on_stage("Parsing page content...", 40)
+            head, structure, text_content = _cached(
+                self.url, 'document', lambda: self._parse_document(response, body), self.cache_ttl
+            )
+
+            on_stage("Analyzing website content...", 60)
+            meta_analysis = self.analyze_meta_tags(head)
+            content_analysis = self.analyze_content(structure, text_content)
+            link_analysis = self.analyze_links(structure)
+        else:
+            on_stage("Analyzing website content...", 60)
+            head = None
+            unanalyzed = ('meta', 'content', 'links')
+            notice = f"Page is not an HTML document (Content-Type: {response.headers.get('Content-Type')})"
+            meta_analysis, content_analysis, link_analysis = [notice], [notice], [notice]
+        technical_analysis = self.analyze_technical(response, head)
+        speed_analysis = self.analyze_speed(response)
+        security_analysis = self.analyze_security(domain_info)
+
+        # Calculate scores and generate improvements
+        on_stage("Processing results...", 85)
+        scores, improvements = self.evaluate({
+            'meta': meta_analysis,
+            'content': content_analysis,
+            'technical': technical_analysis,
+            'speed': speed_analysis,
+            'security': security_analysis,
+            'links': link_analysis
+        }, unanalyzed)
+
+        on_stage("Analysis complete!", 100)
         return {
             'overall_score': scores['overall'],
             'metrics': {
@@ -58,7 +208,7 @@ class SEOAnalyzer:
                 'Links': scores['links']
             },
             'load_time': time.time() - start_time,
-            'mobile_friendly': self.check_mobile_friendly(),
+            'mobile_friendly': self.check_mobile_friendly(response, head),
             'ssl_certified': self.url.startswith('https'),
             'meta_analysis': meta_analysis,
             'content_analysis': content_analysis,
@@ -69,12 +219,116 @@ class SEOAnalyzer:
             'improvements': improvements
         }
 
-    def analyze_meta_tags(self, soup) -> List[str]:
+    def _fetch_page(self):
+        """Download the page being audited, keeping at most MAX_PAGE_BYTES of its body
+
+        Returns the response, its body and the seconds the download took.
+        """
+        # A new download invalidates anything parsed from the previous one
+        _CACHE.pop((self.url, 'document'), None)
+
+        start_time = time.time()
+        chunks = []
+        size = 0
+        with self.session.get(self.url, headers=self.headers, stream=True) as response:
+            # Nothing is parsed from non-HTML responses, so their body is never downloaded
+            if not _is_html(response):
+                return response, b'', time.time() - start_time
+            for chunk in response.iter_content(65536):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= MAX_PAGE_BYTES:
+                    break
+        return response, b''.join(chunks)[:MAX_PAGE_BYTES], time.time() - start_time
+
+    async def _fetch_domain_info(self):
+        """Look up WHOIS data for the site's domain, or None if unavailable in time"""
+        loop = asyncio.get_running_loop()
+        lookup = loop.run_in_executor(_WHOIS_EXECUTOR, _whois_lookup, urlparse(self.url).netloc)
+        try:
+            # One deadline covers queueing and running; a lookup that misses it
+            # keeps going and fills the cache for later audits
+            return await asyncio.wait_for(lookup, WHOIS_TIMEOUT)
+        except Exception:
+            return None
+
+    def _parse_document(self, response, body):
+        """Parse the page into its head primitives, page structure and main text content"""
+        tree = self._build_tree(_decode_body(response, body), body)
+
+        # Collect head primitives and structure before trafilatura gets to work on the tree
+        head = self._extract_head_primitives(tree)
+        structure = self._extract_structure(tree)
+
+        # Extract main text content from the tree we already parsed
+        text_content = trafilatura.extract(tree, url=self.url) if tree is not None else None
+        return head, structure, text_content
+
+    def _build_tree(self, text, body):
+        """Parse the page into an lxml tree, or None if it is not parseable"""
+        try:
+            try:
+                return html.document_fromstring(text, parser=_HTML_PARSER)
+            except ValueError:
+                # lxml refuses str input carrying an XML encoding declaration
+                return html.document_fromstring(body, parser=_HTML_PARSER)
+        except etree.ParserError:
+            return None
+
+    def _extract_head_primitives(self, tree) -> Dict:
+        """Collect what the meta and technical checks need in one walk over the head tags"""
+        first = {}
+        og_count = 0
+        for tag in _HEAD_XPATH(tree) if tree is not None else ():
+            if tag.tag == 'title':
+                key = 'title'
+            elif tag.tag == 'link':
+                key = 'canonical' if 'canonical' in tag.get('rel', '').split() else None
+            else:
+                key = tag.get('name') if tag.get('name') in ('description', 'robots', 'viewport') else None
+                if _OG_PROPERTY_RE.search(tag.get('property', '')):
+                    og_count += 1
+            # Only the first matching tag counts
+            if key and key not in first:
+                first[key] = tag
+
+        title = first.get('title')
+        description = first.get('description')
+        robots = first.get('robots')
+        canonical = first.get('canonical')
+        viewport = first.get('viewport')
+        return {
+            'title': title.text if title is not None else None,
+            'meta_description': description.get('content') if description is not None else None,
+            'robots': robots.get('content', '') if robots is not None else None,
+            'canonical': canonical.get('href', '') if canonical is not None else None,
+            'viewport': viewport.get('content', '') if viewport is not None else None,
+            'og_count': og_count
+        }
+
+    def _extract_structure(self, tree) -> Dict:
+        """Count headings and keep the image and link attributes the checks read
+
+        Only plain values are kept, so a cached parse does not hold the page tree alive.
+        """
+        headings = dict.fromkeys(_HEADING_TAGS, 0)
+        images = []
+        links = []
+        for element in _STRUCTURE_XPATH(tree) if tree is not None else ():
+            if element.tag == 'img':
+                images.append((element.get('alt'), element.get('src', '')))
+            elif element.tag == 'a':
+                links.append((element.get('href'), element.get('rel', '')))
+            else:
+                headings[element.tag] += 1
+        return {'headings': headings, 'images': images, 'links': links}
+
+    def analyze_meta_tags(self, head) -> List[str]:
         """Enhanced meta tags analysis"""
         analysis = []
 
         # Title analysis
-        title = soup.title.string if soup.title else None
+        title = head['title']
         if title:
             title_length = len(title)
             if title_length < 30:
@@ -87,9 +341,9 @@ class SEOAnalyzer:
             analysis.append("Missing title tag")
 
         # Meta description analysis
-        meta_desc = soup.find('meta', {'name': 'description'})
-        if meta_desc and meta_desc.get('content'):
-            desc_length = len(meta_desc['content'])
+        meta_desc = head['meta_description']
+        if meta_desc:
+            desc_length = len(meta_desc)
             if desc_length < 120:
                 analysis.append(f"Meta description is too short ({desc_length} chars, recommended: 120-155)")
             elif desc_length > 155:
@@ -100,41 +354,40 @@ class SEOAnalyzer:
             analysis.append("Missing meta description")
 
         # Check robots meta tag
-        robots = soup.find('meta', {'name': 'robots'})
-        if robots:
-            analysis.append(f"Robots meta tag found: {robots.get('content', '')}")
+        robots = head['robots']
+        if robots is not None:
+            analysis.append(f"Robots meta tag found: {robots}")
         else:
             analysis.append("No robots meta tag found")
 
         # Check canonical URL
-        canonical = soup.find('link', {'rel': 'canonical'})
-        if canonical:
-            analysis.append(f"Canonical URL is set to: {canonical.get('href', '')}")
+        canonical = head['canonical']
+        if canonical is not None:
+            analysis.append(f"Canonical URL is set to: {canonical}")
         else:
             analysis.append("No canonical URL specified")
 
         # Check viewport
-        viewport = soup.find('meta', {'name': 'viewport'})
-        if viewport:
+        if head['viewport'] is not None:
             analysis.append("Viewport meta tag is properly set for mobile devices")
         else:
             analysis.append("Missing viewport meta tag for mobile responsiveness")
 
         # Check Open Graph tags
-        og_tags = soup.find_all('meta', property=re.compile('^og:'))
-        if og_tags:
-            analysis.append(f"Found {len(og_tags)} Open Graph tags for social media sharing")
+        og_count = head['og_count']
+        if og_count:
+            analysis.append(f"Found {og_count} Open Graph tags for social media sharing")
         else:
             analysis.append("No Open Graph tags found for social media optimization")
 
         return analysis
 
-    def analyze_content(self, soup, text_content) -> List[str]:
+    def analyze_content(self, structure, text_content) -> List[str]:
         """Enhanced content analysis"""
         analysis = []
 
         # Heading structure analysis
-        headings = {f'h{i}': len(soup.find_all(f'h{i}')) for i in range(1, 7)}
+        headings = structure['headings']
         if headings['h1'] == 0:
             analysis.append("Missing H1 heading (main title)")
         elif headings['h1'] > 1:
@@ -144,10 +397,13 @@ class SEOAnalyzer:
         analysis.append(f"Heading structure: {', '.join(f'{k}: {v}' for k, v in headings.items() if v > 0)}")
 
         # Image analysis
-        images = soup.find_all('img')
-        total_images = len(images)
-        images_without_alt = len([img for img in images if not img.get('alt')])
-        large_images = len([img for img in images if img.get('src', '').endswith(('.png', '.jpg', '.jpeg'))])
+        total_images = images_without_alt = large_images = 0
+        for alt, src in structure['images']:
+            total_images += 1
+            if not alt:
+                images_without_alt += 1
+            if src.endswith(('.png', '.jpg', '.jpeg')):
+                large_images += 1
 
         analysis.append(f"Total images: {total_images}")
         if images_without_alt > 0:
@@ -157,8 +413,7 @@ class SEOAnalyzer:
 
         # Content analysis
         if text_content:
-            words = text_content.split()
-            word_count = len(words)
+            word_count = len(text_content.split())
 
             # Word count analysis
             if word_count < 300:
@@ -167,22 +422,19 @@ class SEOAnalyzer:
                 analysis.append(f"Good content length: {word_count} words")
 
             # Keyword density
-            word_freq = {}
-            for word in words:
-                if len(word) > 3:  # Skip short words
-                    word = word.lower()
-                    word_freq[word] = word_freq.get(word, 0) + 1
+            word_freq = Counter(_WORD_RE.findall(text_content.lower()))
 
             # Get top keywords
-            top_keywords = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:5]
+            top_keywords = word_freq.most_common(5)
             analysis.append("Top 5 keywords and their density:")
+            density_scale = 100 / word_count
             for word, count in top_keywords:
-                density = (count / word_count) * 100
+                density = count * density_scale
                 analysis.append(f"- '{word}': {density:.1f}% ({count} occurrences)")
 
         return analysis
 
-    def analyze_technical(self, response, soup) -> List[str]:
+    def analyze_technical(self, response, head) -> List[str]:
         """Enhanced technical analysis"""
         analysis = []
 
@@ -216,10 +468,9 @@ class SEOAnalyzer:
             analysis.append(f"URL structure is deep ({path_depth} levels, recommended: maximum 3)")
 
         # Mobile optimization
-        viewport_meta = soup.find('meta', {'name': 'viewport'})
-        if viewport_meta:
-            content = viewport_meta.get('content', '')
-            if 'width=device-width' in content and 'initial-scale=1' in content:
+        viewport = head['viewport'] if head is not None else None
+        if viewport is not None:
+            if 'width=device-width' in viewport and 'initial-scale=1' in viewport:
                 analysis.append("Viewport is properly configured for mobile devices")
             else:
                 analysis.append("Viewport meta tag needs optimization")
@@ -248,7 +499,7 @@ class SEOAnalyzer:
 
         return analysis
 
-    def analyze_security(self) -> List[str]:
+    def analyze_security(self, domain_info) -> List[str]:
         """Analyze security aspects"""
         analysis = []
 
@@ -258,11 +509,8 @@ class SEOAnalyzer:
         else:
             analysis.append("Website is not using HTTPS (security risk)")
 
-        # Domain registration info
+        # Domain registration info (domain_info is None when the lookup failed)
         try:
-            domain = urlparse(self.url).netloc
-            domain_info = whois.whois(domain)
-
             if domain_info.creation_date:
                 creation_date = domain_info.creation_date
                 if isinstance(creation_date, list):
@@ -281,19 +529,18 @@ class SEOAnalyzer:
 
         return analysis
 
-    def analyze_links(self, soup) -> List[str]:
+    def analyze_links(self, structure) -> List[str]:
         """Analyze internal and external links"""
         analysis = []
 
-        links = soup.find_all('a', href=True)
+        links = [href for href, _ in structure['links'] if href is not None]
         internal_links = []
         external_links = []
         broken_links = []
 
         base_domain = urlparse(self.url).netloc
 
-        for link in links:
-            href = link.get('href')
+        for href in links:
             if not href or href.startswith('#'):
                 continue
 
@@ -310,91 +557,70 @@ class SEOAnalyzer:
         analysis.append(f"External links: {len(external_links)}")
 
         # Check for nofollow attributes
-        nofollow_links = len(soup.find_all('a', rel='nofollow'))
+        nofollow_links = sum(1 for _, rel in structure['links'] if 'nofollow' in rel.split())
         if nofollow_links > 0:
             analysis.append(f"Links with nofollow: {nofollow_links}")
 
         return analysis
 
-    def check_mobile_friendly(self) -> bool:
-        """Enhanced mobile-friendly check"""
-        try:
-            response = requests.get(self.url, headers={
-                **self.headers,
-                'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 14_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1'
-            })
-            return response.status_code == 200
-        except:
+    def check_mobile_friendly(self, response, head) -> bool:
+        """Mobile-friendly check based on the already fetched page"""
+        if response.status_code != 200 or head is None:
             return False
+        return 'width=device-width' in (head['viewport'] or '')
 
-    def calculate_scores(self, meta_analysis, content_analysis, technical_analysis,
-                        speed_analysis, security_analysis, link_analysis) -> Dict[str, float]:
-        """Enhanced scoring system"""
-
-        def count_issues(analysis: List[str], keywords: List[str]) -> int:
-            return len([x for x in analysis if any(k in x.lower() for k in keywords)])
-
-        # Calculate individual scores
-        meta_score = 100 - (count_issues(meta_analysis, ['missing', 'too', 'no']) * 15)
-        content_score = 100 - (count_issues(content_analysis, ['missing', 'too short', 'multiple']) * 10)
-        technical_score = 100 - (count_issues(technical_analysis, ['not', 'slow', 'needs']) * 20)
-        speed_score = 100 - (count_issues(speed_analysis, ['slow', 'large']) * 25)
-        security_score = 100 - (count_issues(security_analysis, ['not', 'risk', 'could not']) * 30)
-        link_score = 100 - (count_issues(link_analysis, ['broken', 'invalid']) * 15)
-
-        # Normalize scores to 0-100 range
-        scores = {
-            'meta': max(0, min(100, meta_score)),
-            'content': max(0, min(100, content_score)),
-            'technical': max(0, min(100, technical_score)),
-            'speed': max(0, min(100, speed_score)),
-            'security': max(0, min(100, security_score)),
-            'links': max(0, min(100, link_score))
-        }
+    def evaluate(self, analyses: Dict[str, List[str]], unanalyzed=()) -> Tuple[Dict[str, float], List[str]]:
+        """Score every category and collect improvement suggestions in a single pass
 
-        # Calculate weighted overall score
-        weights = {
-            'meta': 0.2,
-            'content': 0.25,
-            'technical': 0.15,
-            'speed': 0.15,
-            'security': 0.15,
-            'links': 0.1
-        }
+        Categories in unanalyzed had nothing to check; they score 0 and suggest nothing.
+        """
+        scores = {}
+        improvements = []
+        overall_score = 0
+
+        for key, category, issue_re, penalty, weight in _SCORING_RULES:
+            if key in unanalyzed:
+                scores[key] = 0
+                continue
+
+            issues = 0
+            for finding in analyses[key]:
+                lower = finding.lower()
+                if issue_re.search(lower):
+                    issues += 1
+                if _IMPROVEMENT_RE.search(lower):
+                    suggestion = _SUGGESTION_RE.sub(lambda m: _SUGGESTION_REWRITES[m.group()], finding)
+                    improvements.append(f"[{category}] {suggestion}")
+
+            # Normalize scores to 0-100 range and accumulate the weighted overall score
+            scores[key] = max(0, min(100, 100 - issues * penalty))
+            overall_score += scores[key] * weight
 
-        overall_score = sum(scores[k] * weights[k] for k in scores)
         scores['overall'] = max(0, min(100, overall_score))
 
-        return scores
+        return scores, improvements
 
-    def generate_improvements(self, meta_analysis, content_analysis, technical_analysis,
-                            speed_analysis, security_analysis, link_analysis) -> List[str]:
-        """Generate comprehensive improvement suggestions"""
-        improvements = []
+def run_analysis(url, progress=None, cache_ttl=CACHE_TTL):
+    """Analyze a single URL; a module-level entry point so worker processes can run it
 
-        # Collect all analyses
-        all_analyses = {
-            'Meta Tags': meta_analysis,
-            'Content': content_analysis,
-            'Technical': technical_analysis,
-            'Speed': speed_analysis,
-            'Security': security_analysis,
-            'Links': link_analysis
-        }
+    progress, if given, is a queue that receives a (stage, percent) tuple per stage.
+    A cache_ttl of 0 always fetches the page again.
+    """
+    on_stage = (lambda name, percent: progress.put((name, percent))) if progress is not None else None
+    return SEOAnalyzer(url, cache_ttl).analyze(on_stage)
 
-        # Keywords indicating issues
-        issue_keywords = ['missing', 'too', 'no', 'not', 'slow', 'large', 'multiple', 'broken']
-
-        # Generate improvements for each category
-        for category, analysis in all_analyses.items():
-            for issue in analysis:
-                if any(keyword in issue.lower() for keyword in issue_keywords):
-                    suggestion = issue
-                    suggestion = suggestion.replace('Missing', 'Add')
-                    suggestion = suggestion.replace('Too short', 'Increase length of')
-                    suggestion = suggestion.replace('Too long', 'Reduce length of')
-                    suggestion = suggestion.replace('No ', 'Add ')
-                    suggestion = suggestion.replace('Not ', 'Enable ')
-                    improvements.append(f"[{category}] {suggestion}")
+async def analyze_many(urls, concurrency=BATCH_CONCURRENCY):
+    """Analyze several URLs concurrently, auditing at most one page per host at a time
+
+    Results come back in the order of urls; an audit that fails yields its exception.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    host_locks = defaultdict(asyncio.Lock)
+
+    async def audit(url):
+        # Take the host lock first so queued same-host audits don't hold a slot
+        async with host_locks[urlparse(url).netloc]:
+            async with semaphore:
+                return await asyncio.to_thread(run_analysis, url)
 
-        return improvements
\ No newline at end of file
+    return await asyncio.gather(*(audit(url) for url in urls), return_exceptions=True)
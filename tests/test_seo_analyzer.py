@@ -0,0 +1,86 @@
+import asyncio
+import functools
+import http.server
+import os
+import threading
+import time
+import unittest
+from unittest import mock
+
+import seo_analyzer
+from seo_analyzer import SEOAnalyzer
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+class _QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class PageDecodingTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        handler = functools.partial(_QuietHandler, directory=FIXTURES)
+        cls.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def analyze_content(self, page):
+        analyzer = SEOAnalyzer(f'http://127.0.0.1:{self.server.server_port}/{page}')
+        response, body, _ = analyzer._fetch_page()
+        head, structure, text_content = analyzer._parse_document(response, body)
+        return response, head, analyzer.analyze_content(structure, text_content)
+
+    def test_utf8_page_without_header_charset(self):
+        # http.server sends a bare "text/html", which requests reads as ISO-8859-1
+        response, head, analysis = self.analyze_content('utf8_meta_charset.html')
+        self.assertNotIn('charset', response.headers['Content-Type'])
+        self.assertEqual(head['title'], 'Une séance naïve sur le réseau')
+        keywords = '\n'.join(line for line in analysis if line.startswith("- '"))
+        for word in ('séance', 'naïve', 'élève', 'réseau'):
+            self.assertIn(f"'{word}'", keywords)
+
+
+class WhoisDeadlineTest(unittest.TestCase):
+    TIMEOUT = 0.5
+
+    def setUp(self):
+        seo_analyzer._whois_lookup.cache_clear()
+        self.timeouts = []
+        patches = (
+            mock.patch.object(seo_analyzer, 'WHOIS_TIMEOUT', self.TIMEOUT),
+            mock.patch.object(seo_analyzer.whois, 'whois', self.stuck_lookup),
+        )
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def stuck_lookup(self, domain, timeout=10):
+        # A registrar that never answers: the lookup ends when its socket times out
+        self.timeouts.append(timeout)
+        time.sleep(min(8, timeout))
+        raise TimeoutError(domain)
+
+    async def fetch_batch(self, batch, size):
+        analyzers = [SEOAnalyzer(f'http://{batch}-{i}.test/') for i in range(size)]
+        return await asyncio.gather(*(analyzer._fetch_domain_info() for analyzer in analyzers))
+
+    def test_deadline_holds_when_executor_is_saturated(self):
+        size = seo_analyzer._WHOIS_EXECUTOR._max_workers + 2
+        # The second batch arrives while the first still holds every thread
+        for batch in ('first', 'second'):
+            start = time.monotonic()
+            results = asyncio.run(self.fetch_batch(batch, size))
+            self.assertLess(time.monotonic() - start, self.TIMEOUT + 0.3)
+            self.assertEqual(results, [None] * size)
+        self.assertTrue(self.timeouts)
+        self.assertTrue(all(timeout == self.TIMEOUT for timeout in self.timeouts))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,25 +1,104 @@
+from functools import lru_cache
 from urllib.parse import urlparse
 import re
 
+# An http(s) scheme followed by a non-empty host, for bulk validation
+_BULK_URL_PATTERN = r'^https?://[^/?#\s]+'
+_bulk_url_matcher = None
+
 def is_valid_url(url):
     """Validate URL format"""
+    if not isinstance(url, str):
+        return False
+    return _check_url(url)
+
+@lru_cache(maxsize=1024)
+def _check_url(url):
+    """Check for an http(s) scheme followed by a non-empty host"""
+    # Plain ASCII URLs only need the scheme and host located, not a full parse
+    if url.isascii() and url.isprintable() and ' ' not in url:
+        head = url[:8].lower()
+        if head.startswith('http://'):
+            rest = url[7:]
+        elif head == 'https://':
+            rest = url[8:]
+        else:
+            return False
+        end = len(rest)
+        for delimiter in '/?#':
+            index = rest.find(delimiter, 0, end)
+            if index != -1:
+                end = index
+        netloc = rest[:end]
+        # Bracketed IPv6 hosts still need urlparse's validation
+        if '[' not in netloc and ']' not in netloc:
+            return bool(netloc)
+
     try:
         result = urlparse(url)
-        return all([result.scheme, result.netloc]) and result.scheme in ['http', 'https']
-    except:
+        return bool(result.netloc) and result.scheme in ('http', 'https')
+    except ValueError:
         return False
 
+def clear_url_cache():
+    """Forget memoized URL validation results"""
+    _check_url.cache_clear()
+
+def url_cache_info():
+    """Report hits, misses and size of the URL validation cache"""
+    return _check_url.cache_info()
+
+def validate_urls(urls):
+    """Validate many URLs at once, returning a list of booleans aligned with urls"""
+    global _bulk_url_matcher
+    if _bulk_url_matcher is None:
+        _bulk_url_matcher = _compile_bulk_url_matcher()
+    return _bulk_url_matcher(urls)
+
+def _compile_bulk_url_matcher():
+    """Build the bulk matcher once, using a Hyperscan DFA when it is installed"""
+    try:
+        import hyperscan
+    except ImportError:
+        # ASCII-only \s and case folding, as Hyperscan applies them without HS_FLAG_UCP
+        match = re.compile(_BULK_URL_PATTERN, re.IGNORECASE | re.ASCII).match
+        return lambda urls: [isinstance(url, str) and match(url) is not None for url in urls]
+
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    database.compile(
+        expressions=[_BULK_URL_PATTERN.encode()],
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH]
+    )
+
+    def on_match(expression_id, start, end, flags, hits):
+        hits.append(True)
+
+    def match_all(urls):
+        # Scratch space is per call so concurrent batches don't share it
+        scratch = hyperscan.Scratch(database)
+        results = []
+        for url in urls:
+            hits = []
+            if isinstance(url, str):
+                database.scan(url.encode('utf-8', 'surrogatepass'), match_event_handler=on_match,
+                              context=hits, scratch=scratch)
+            results.append(bool(hits))
+        return results
+
+    return match_all
+
 def calculate_percentage(value, total):
     """Calculate percentage with proper rounding"""
-    try:
-        return round((value / total) * 100, 1)
-    except ZeroDivisionError:
+    if not total:
         return 0
+    # Counts round to one decimal in integer math, halves rounding up
+    if isinstance(value, int) and isinstance(total, int) and total > 0:
+        return (value * 1000 + total // 2) // total / 10
+    return round((value / total) * 100, 1)
 
 def clean_text(text):
     """Clean and normalize text content"""
     if not text:
         return ""
-    # Remove extra whitespace and normalize spaces
-    text = re.sub(r'\s+', ' ', text.strip())
-    return text
+    # Remove extra whitespace and normalize spaces; split() drops the ends as well
+    return ' '.join(text.split())
@@ -1,64 +1,96 @@
-import plotly.graph_objects as go
+from functools import lru_cache
 import streamlit as st
 
-def create_score_gauge(score):
-    """Create a gauge chart for the overall SEO score"""
-    fig = go.Figure(go.Indicator(
-        mode = "gauge+number",
-        value = score,
-        domain = {'x': [0, 1], 'y': [0, 1]},
-        gauge = {
-            'axis': {'range': [0, 100], 'tickwidth': 1},
-            'bar': {'color': "rgba(255, 75, 75, 0.8)"},
-            'steps': [
-                {'range': [0, 33], 'color': "rgba(255, 0, 0, 0.1)"},
-                {'range': [33, 66], 'color': "rgba(255, 165, 0, 0.1)"},
-                {'range': [66, 100], 'color': "rgba(0, 255, 0, 0.1)"}
-            ],
-            'threshold': {
-                'line': {'color': "white", 'width': 4},
-                'thickness': 0.75,
-                'value': score
-            }
-        }
-    ))
+_CHART_COLOR = "rgba(255, 75, 75, 0.8)"
 
-    fig.update_layout(
-        height=300,
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)",
-        font={'color': "white"}
+# Static parts of the figures, built once; only the data is spliced in per figure
+_GAUGE_STYLE = {
+    'axis': {'range': [0, 100], 'tickwidth': 1},
+    'bar': {'color': _CHART_COLOR},
+    'steps': [
+        {'range': [0, 33], 'color': "rgba(255, 0, 0, 0.1)"},
+        {'range': [33, 66], 'color': "rgba(255, 165, 0, 0.1)"},
+        {'range': [66, 100], 'color': "rgba(0, 255, 0, 0.1)"}
+    ]
+}
+_GAUGE_THRESHOLD_STYLE = {
+    'line': {'color': "white", 'width': 4},
+    'thickness': 0.75
+}
+_GAUGE_LAYOUT = dict(
+    height=300,
+    paper_bgcolor="rgba(0,0,0,0)",
+    plot_bgcolor="rgba(0,0,0,0)",
+    font={'color': "white"}
+)
+_METRICS_LAYOUT = dict(
+    _GAUGE_LAYOUT,
+    yaxis=dict(
+        range=[0, 100],
+        gridcolor='rgba(255,255,255,0.1)'
+    ),
+    xaxis=dict(
+        gridcolor='rgba(255,255,255,0.1)'
     )
+)
 
-    st.plotly_chart(fig, use_container_width=True)
+# Figures are cached as shared objects (st.cache_data would unpickle, and so
+# re-validate, a fresh copy on every hit); callers must never mutate them.
+# They stay Figures: st.plotly_chart re-validates a plain dict into a Figure.
 
-def create_metrics_chart(metrics):
-    """Create a bar chart for different SEO metrics"""
-    fig = go.Figure()
-    
-    categories = list(metrics.keys())
-    values = list(metrics.values())
-    
-    fig.add_trace(go.Bar(
-        x=categories,
-        y=values,
-        marker_color='rgba(255, 75, 75, 0.8)',
-        text=values,
-        textposition='auto',
-    ))
+# One slot per whole-point score, so every gauge is built at most once
+@lru_cache(maxsize=101)
+def _build_score_gauge(score):
+    """Build the gauge figure for a score"""
+    import plotly.graph_objects as go
+
+    return go.Figure(
+        data=go.Indicator(
+            mode = "gauge+number",
+            value = score,
+            domain = {'x': [0, 1], 'y': [0, 1]},
+            gauge = {**_GAUGE_STYLE, 'threshold': {**_GAUGE_THRESHOLD_STYLE, 'value': score}}
+        ),
+        layout=_GAUGE_LAYOUT
+    )
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+def _build_metrics_chart(items):
+    """Build the bar chart figure for a tuple of (category, value) pairs"""
+    import numpy as np
+    import plotly.graph_objects as go
 
-    fig.update_layout(
-        height=300,
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)",
-        font={'color': "white"},
-        yaxis=dict(
-            range=[0, 100],
-            gridcolor='rgba(255,255,255,0.1)'
+    categories, values = zip(*items)
+    # A float32 array ships to the browser as compact binary rather than JSON numbers
+    heights = np.fromiter(values, dtype=np.float32, count=len(values))
+
+    return go.Figure(
+        data=go.Bar(
+            x=categories,
+            y=heights,
+            marker_color=_CHART_COLOR,
+            text=[f"{value:.0f}" for value in values],
+            # Outside labels need no fit measurement; unclipped so a 100 stays visible
+            textposition='outside',
+            cliponaxis=False,
         ),
-        xaxis=dict(
-            gridcolor='rgba(255,255,255,0.1)'
-        )
+        layout=_METRICS_LAYOUT
     )
 
-    st.plotly_chart(fig, use_container_width=True)
+# Each chart renders in its own fragment so it can rerun without the other
+
+@st.fragment
+def create_score_gauge(score):
+    """Create a gauge chart for the overall SEO score"""
+    # Whole points are all the gauge can show, and they keep the figure cache small
+    score = int(round(max(0, min(100, score))))
+    st.plotly_chart(_build_score_gauge(score), use_container_width=True)
+
+@st.fragment
+def create_metrics_chart(metrics):
+    """Create a bar chart for different SEO metrics"""
+    if not metrics:
+        return
+
+    # Items keep the display order and, unlike the dict, are hashable for the cache
+    st.plotly_chart(_build_metrics_chart(tuple(metrics.items())), use_container_width=True)